@@ -4,8 +4,10 @@
 # 2) 단어 자동 글자 크기 조절(좌/우 겹침 방지)
 # 3) 게임 종료 시 생존 시간 기반 점수 표시 (Score = SurvivedSeconds * 100)
 
-import os, sys, random, pygame, requests
-from dataclasses import dataclass
+import os, sys, random, queue, threading, pygame, requests
+from dataclasses import dataclass, field
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
 from enum import Enum, auto
 from typing import Optional, Tuple, List
 
@@ -14,6 +16,8 @@ from typing import Optional, Tuple, List
 # -----------------------------
 WIDTH, HEIGHT = 900, 760
 FPS = 60
+IDLE_FPS = 30        # 메뉴/게임오버 화면 프레임 제한
+IDLE_WAIT_MS = 100   # 메뉴/게임오버에서 입력 대기 최대 시간
 COLS = 10
 CELL_W = 56
 FIELD_W = COLS * CELL_W
@@ -26,6 +30,8 @@ IMAGE_DIR = os.path.join(os.path.dirname(__file__), "images")
 PLAYER_SIZE = (44, 44)
 BLOCK_H = 28
 STEP_PX = BLOCK_H
+GROUND_HIT_Y = GROUND_Y - BLOCK_H  # 블록 y 가 이 값 이상이면 바닥 도달
+BLOCK_LEN_MAX = min(4, COLS - 1)
 
 SLOW_FACTOR = 1.0
 
@@ -33,19 +39,55 @@ ACCEL_RATIO = 1.10
 ACCEL_INTERVAL_START_MS = 30_000
 ACCEL_INTERVAL_STEP_MS = 5_000
 ACCEL_INTERVAL_MIN_MS = 10_000
+ACCEL_EVENT = pygame.USEREVENT + 1  # 가속 시점 타이머 이벤트
 
 SPAWN_MS_LOWER_BOUND = 220
 
 # API 설정 - Random Word API
 API_BASE_URL = "https://random-word-api.herokuapp.com/word"
-WORD_CACHE: List[str] = []
-
-LETTERS = "asdfjklghqwertyuiopzxcvbnm1234567890"
+# 연결 재사용(keep-alive) → 두 번째 호출부터 TLS 핸드셰이크 생략
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+WORD_QUEUE: "queue.Queue[str]" = queue.Queue()
+WORD_QUEUE_LOW = 20          # 이보다 적으면 백그라운드에서 보충
+_WORD_REFILL = threading.Event()
+# API 실패 시 / 첫 단어들이 도착하기 전에 쓰는 기본 단어 목록
+FALLBACK_WORDS = [
+    "cat","dog","run","jump","play","book","tree","sun","moon","star",
+    "bird","fish","love","hope","time","word","good","best","fast","slow",
+    "apple","water","house","happy","friend","music","smile","peace","dream","light",
+    "strong","bright","quiet","travel","beauty","nature","winter","spring","summer","autumn",
+    "mountain","river","forest","garden","flower","butterfly","rainbow","thunder","ocean","desert"
+]
+
+LETTERS = tuple("asdfjklghqwertyuiopzxcvbnm1234567890")
+# 단어는 LETTERS 범위의 문자로만 이루어지므로 입력도 이 문자들만 받음
+TYPEABLE_CHARS = frozenset(LETTERS)
 FONT_NAME = "malgungothic"
 
 MOVES_PER_SEC = 2.8
 SAFETY_MARGIN_MS = 400
 
+# 이동 결과 테이블: MOVE_TABLE[d + 1][col] -> 이동 후 열 (d = -1, 0, +1)
+MOVE_TABLE = [[max(0, min(COLS - 1, c + d)) for c in range(COLS)] for d in (-1, 0, 1)]
+
+def _nearest_safe_moves(player_col: int, start_col: int, length: int) -> int:
+    left = start_col - 1
+    right = start_col + length
+    if left >= 0:
+        if right <= COLS - 1:
+            return min(abs(player_col - left), abs(player_col - right))
+        return abs(player_col - left)
+    if right <= COLS - 1:
+        return abs(player_col - right)
+    return 0
+
+# 스폰 안전 시간 테이블: SPAWN_NEED_MS[player_col][start_col][length] -> 피하는 데 필요한 ms
+SPAWN_NEED_MS = [[[int((_nearest_safe_moves(p, s, l) / MOVES_PER_SEC) * 1000) + SAFETY_MARGIN_MS
+                   for l in range(COLS + 1)]
+                  for s in range(COLS)]
+                 for p in range(COLS)]
+
 # -----------------------------
 # 중앙 오버레이 레이아웃
 # -----------------------------
@@ -57,6 +99,8 @@ ARROW_X_GAP = 150
 LEFT_WORD_COLOR = (18, 120, 255)
 RIGHT_WORD_COLOR = (255, 140, 0)
 WORD_OUTLINE = (0, 0, 0)
+WORD_OUTLINE_OFFSETS = [(-3, 0), (3, 0), (0, -3), (0, 3), (-2, -2), (2, -2), (-2, 2), (2, 2)]
+WORD_OUTLINE_PAD = 3
 
 CENTER_SAFE_GAP = 24
 MAX_TEXT_WIDTH_PER_SIDE = 2 * (ARROW_X_GAP - CENTER_SAFE_GAP)
@@ -64,6 +108,12 @@ MAX_TEXT_WIDTH_PER_SIDE = 2 * (ARROW_X_GAP - CENTER_SAFE_GAP)
 WORD_FONT_MAX = 58
 WORD_FONT_MIN = 18
 
+HUD_HELP_LINES = [
+    "Enter: confirm word",
+    "Backspace: delete input",
+    "ESC: quit, (Game Over) R: restart",
+]
+
 # -----------------------------
 # Stage 정의
 # -----------------------------
@@ -78,29 +128,89 @@ STAGE_PRESETS: dict[int, StageConf] = {
     3: StageConf(steps_per_sec=2.4, spawn_ms=3500),
 }
 
+STAGE_LABELS = [
+    "Stage 1  — 쉬움, 1 step/s, spawn=8.0s",
+    "Stage 2  — 보통, 1.8 step/s, 5.5s",
+    "Stage 3  — 어려움, 2.4 step/s, 3.5s",
+]
+
 # -----------------------------
 # 유틸
 # -----------------------------
+@lru_cache(maxsize=None)
 def load_image(path: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+    # (경로, 크기) 별로 한 번만 디코딩/스케일 — 실패(None)도 캐시해 경고가 반복되지 않음
     if not os.path.isfile(path):
         print(f"Warning: Image not found - {path}")
         return None
+    # convert_alpha() 는 디스플레이 포맷이 있어야 하므로 set_mode 이후에만 호출
+    assert pygame.display.get_surface() is not None, "load_image() called before display init"
     try:
         img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.smoothscale(img, size) if size else img
+        # smoothscale 결과도 디스플레이 포맷으로 맞춰 blit 시 변환 비용 제거
+        return pygame.transform.smoothscale(img, size).convert_alpha() if size else img
     except Exception as e:
         print(f"Error loading image {path}: {e}")
         return None
 
+@lru_cache(maxsize=64)
+def step_interval_for(steps_per_sec: float) -> int:
+    # 같은 속도(스테이지 기본값 x 가속 배율)는 모든 블록이 공유하므로 한 번만 계산
+    sps = max(0.1, steps_per_sec)
+    return max(60, int(1000 / (sps / SLOW_FACTOR)))
+
+def time_to_ground_ms(y: float, step_interval_ms: int) -> int:
+    remaining_steps = max(0, int((GROUND_Y - (y + BLOCK_H)) // BLOCK_H) + 1)
+    return remaining_steps * step_interval_ms
+
+@lru_cache(maxsize=128)
+def sysfont(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    # SysFont 는 호출마다 시스템 폰트 목록을 뒤지므로 (이름, 크기, 굵기)별로 한 번만 생성
+    return pygame.font.SysFont(name, size, bold=bold)
+
+@lru_cache(maxsize=512)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # 같은 (폰트, 문자열, 색) 조합은 래스터화 결과를 재사용
+    return font.render(text, True, color)
+
+# 블록 길이별로 물고기 타일을 이어 붙인 이미지 (한 번만 만들고 공유)
+_BLOCK_IMG_CACHE: dict[int, pygame.Surface] = {}
+
+def get_block_image(length: int) -> Optional[pygame.Surface]:
+    img = _BLOCK_IMG_CACHE.get(length)
+    if img is None:
+        fish = load_image(os.path.join(IMAGE_DIR, "fish.png"), size=(CELL_W, CELL_W))
+        if fish is None:
+            return None
+        img = pygame.Surface((CELL_W * length, CELL_W), pygame.SRCALPHA).convert_alpha()
+        for i in range(length):
+            # 타일끼리 겹치지 않으므로 ADD 로 알파까지 그대로 복사
+            img.blit(fish, (i * CELL_W, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        _BLOCK_IMG_CACHE[length] = img
+    return img
+
+# 폭발 이미지가 없을 때 쓰는 반투명 막대 (길이별로 한 번만 생성)
+_EXPL_FALLBACK_CACHE: dict[int, pygame.Surface] = {}
+
+def get_explosion_fallback(length: int) -> pygame.Surface:
+    surf = _EXPL_FALLBACK_CACHE.get(length)
+    if surf is None:
+        w, h = CELL_W * length, CELL_W // 2
+        surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+        surf.fill((255, 180, 60, 150))
+        pygame.draw.rect(surf, (255, 120, 0), (0, 0, w, h), width=2, border_radius=6)
+        _EXPL_FALLBACK_CACHE[length] = surf
+    return surf
+
 def fetch_words_from_api(count: int = 100) -> List[str]:
     words = []
     try:
         params = {'number': count}
-        response = requests.get(API_BASE_URL, params=params, timeout=5)
+        response = _SESSION.get(API_BASE_URL, params=params, timeout=5)
         if response.status_code == 200:
             word_list = response.json()
             for word in word_list:
-                if isinstance(word, str) and word.isalpha():
+                if isinstance(word, str) and word.isascii() and word.isalpha():
                     words.append(word.lower())
             print(f"✅ API에서 {len(words)}개 단어 로딩 성공")
         else:
@@ -108,28 +218,34 @@ def fetch_words_from_api(count: int = 100) -> List[str]:
     except Exception as e:
         print(f"❌ API 호출 실패: {e}")
         print("기본 단어 목록을 사용합니다.")
-        fallback_words = [
-            "cat","dog","run","jump","play","book","tree","sun","moon","star",
-            "bird","fish","love","hope","time","word","good","best","fast","slow",
-            "apple","water","house","happy","friend","music","smile","peace","dream","light",
-            "strong","bright","quiet","travel","beauty","nature","winter","spring","summer","autumn",
-            "mountain","river","forest","garden","flower","butterfly","rainbow","thunder","ocean","desert"
-        ]
-        words = fallback_words[:count]
+        words = FALLBACK_WORDS[:count]
     return words
 
+def _word_prefetch_worker():
+    # 네트워크 대기는 이 스레드에서만 (게임 루프는 큐에서 꺼내기만 함)
+    while True:
+        _WORD_REFILL.wait()
+        _WORD_REFILL.clear()
+        while WORD_QUEUE.qsize() < WORD_QUEUE_LOW:
+            words = fetch_words_from_api(100)
+            if not words:
+                break
+            random.shuffle(words)
+            for w in words:
+                WORD_QUEUE.put(w)
+
+def start_word_prefetch():
+    threading.Thread(target=_word_prefetch_worker, name="word-prefetch", daemon=True).start()
+    _WORD_REFILL.set()
+
 def get_random_word() -> str:
-    global WORD_CACHE
-    if len(WORD_CACHE) < 20:
-        new_words = fetch_words_from_api(100)
-        WORD_CACHE.extend(new_words)
-    if WORD_CACHE:
-        word = random.choice(WORD_CACHE)
-        WORD_CACHE.remove(word)
-        return word
-    else:
-        length = random.randint(3, 12)
-        return "".join(random.choice(LETTERS) for _ in range(length))
+    if WORD_QUEUE.qsize() < WORD_QUEUE_LOW:
+        _WORD_REFILL.set()
+    try:
+        return WORD_QUEUE.get_nowait()
+    except queue.Empty:
+        # 아직 도착 전이면 기본 단어 목록에서 (프레임을 막지 않음)
+        return random.choice(FALLBACK_WORDS)
 
 # -----------------------------
 # 엔티티
@@ -146,87 +262,84 @@ class Background:
         pass
     def draw(self):
         self.screen.fill((0, 0, 0))  # 항상 검정색
+    def erase(self, rects: List[pygame.Rect]):
+        for r in rects:
+            self.screen.fill((0, 0, 0), r)
 
 class Player:
     def __init__(self, col: int):
         self.col = col
         self.img = load_image(os.path.join(IMAGE_DIR, "chunsik.png"), size=PLAYER_SIZE)
+        # y 는 고정이므로 Rect 는 하나만 두고 이동 시 x 만 갱신
+        self._rect = pygame.Rect(self._x_for(col), GROUND_Y - PLAYER_SIZE[1] - 2, *PLAYER_SIZE)
+
+    @staticmethod
+    def _x_for(col: int) -> int:
+        return MARGIN_X + col * CELL_W + (CELL_W - PLAYER_SIZE[0]) // 2
 
     @property
     def rect(self) -> pygame.Rect:
-        x = MARGIN_X + self.col * CELL_W + (CELL_W - PLAYER_SIZE[0]) // 2
-        y = GROUND_Y - PLAYER_SIZE[1] - 2
-        return pygame.Rect(x, y, *PLAYER_SIZE)
+        return self._rect
 
     def move(self, d: int):
-        self.col = max(0, min(COLS - 1, self.col + d))
+        self.col = MOVE_TABLE[d + 1][self.col]
+        self._rect.x = self._x_for(self.col)
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         if self.img:
-            screen.blit(self.img, self.rect)
-        else:
-            pygame.draw.rect(screen, (70, 120, 255), self.rect, border_radius=8)
+            return screen.blit(self.img, self.rect)
+        return pygame.draw.rect(screen, (70, 120, 255), self.rect, border_radius=8)
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     start_col: int
     length: int
     steps_per_sec_base: float
+    step_interval_ms: int
     y: float = -BLOCK_H
     acc_ms: int = 0
-    fish_img: Optional[pygame.Surface] = None
+    img: Optional[pygame.Surface] = None
+    _rect: pygame.Rect = field(init=False, repr=False)
 
     def __post_init__(self):
-        if self.fish_img is None:
-            base_fish = load_image(os.path.join(IMAGE_DIR, "fish.png"))
-            if base_fish:
-                self.fish_img = pygame.transform.smoothscale(base_fish, (CELL_W, CELL_W))
-
-    def bind_runtime(self, get_steps_per_sec):
-        self._get_steps_per_sec = get_steps_per_sec
-        self._recompute_step_interval()
-
-    def _recompute_step_interval(self):
-        sps = max(0.1, self._get_steps_per_sec())
-        self.step_interval_ms = max(60, int(1000 / (sps / SLOW_FACTOR)))
+        if self.img is None:
+            self.img = get_block_image(self.length)
+        self._rect = pygame.Rect(MARGIN_X + self.start_col * CELL_W, int(self.y), CELL_W * self.length, BLOCK_H)
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(MARGIN_X + self.start_col * CELL_W, int(self.y), CELL_W * self.length, BLOCK_H)
+        return self._rect
 
-    def update(self, dt: int):
-        self._recompute_step_interval()
-        self.acc_ms += dt
-        while self.acc_ms >= self.step_interval_ms:
-            self.y += STEP_PX
-            self.acc_ms -= self.step_interval_ms
-
-    def hit_ground(self) -> bool:
-        return self.y + BLOCK_H >= GROUND_Y
-
-    def time_to_ground_ms(self) -> int:
-        remaining_steps = max(0, int((GROUND_Y - (self.y + BLOCK_H)) // BLOCK_H) + 1)
-        return remaining_steps * self.step_interval_ms
-
-    def draw(self, screen: pygame.Surface):
-        if self.fish_img:
-            for i in range(self.length):
-                x = MARGIN_X + (self.start_col + i) * CELL_W
-                fish_rect = pygame.Rect(x, int(self.y) + (BLOCK_H - CELL_W) // 2, CELL_W, CELL_W)
-                screen.blit(self.fish_img, fish_rect)
-        else:
-            pygame.draw.rect(screen, (235, 95, 85), self.rect, border_radius=6)
+    def update(self, dt: int) -> bool:
+        # 이동 후 바닥 도달 여부를 함께 반환해 호출 측의 두 번째 검사를 없앰
+        steps, self.acc_ms = divmod(self.acc_ms + dt, self.step_interval_ms)
+        self.y += steps * STEP_PX
+        self._rect.y = int(self.y)
+        return self.y >= GROUND_HIT_Y
 
-@dataclass
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        # Surface.blits() 에 넘길 (이미지, 위치) — img 가 있을 때만 사용
+        return self.img, (self._rect.x, self._rect.y + (BLOCK_H - CELL_W) // 2)
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        if self.img:
+            return screen.blit(*self.blit_item())
+        return pygame.draw.rect(screen, (235, 95, 85), self.rect, border_radius=6)
+
+@dataclass(slots=True)
 class Explosion:
     start_col: int
     length: int
     timer: int = 380
     img: Optional[pygame.Surface] = None
+    pos: Tuple[int, int] = field(init=False, repr=False)
+    mask: int = field(init=False, repr=False)
 
-    @property
-    def danger_cols(self):
-        return self.start_col, self.start_col + self.length - 1
+    def __post_init__(self):
+        # 폭발 위치는 생성 후 바뀌지 않음
+        self.pos = (MARGIN_X + self.start_col * CELL_W, GROUND_Y - (CELL_W // 2))
+        # 위험 열 비트마스크 (bit i = i번째 열)
+        self.mask = ((1 << self.length) - 1) << self.start_col
 
     def update(self, dt: int):
         self.timer -= dt
@@ -234,16 +347,8 @@ class Explosion:
     def alive(self) -> bool:
         return self.timer > 0
 
-    def draw(self, screen: pygame.Surface):
-        x = MARGIN_X + self.start_col * CELL_W
-        y = GROUND_Y - (CELL_W // 2)
-        if self.img:
-            screen.blit(self.img, (x, y))
-        else:
-            s = pygame.Surface((CELL_W * self.length, CELL_W // 2), pygame.SRCALPHA)
-            s.fill((255, 180, 60, 150))
-            screen.blit(s, (x, y))
-            pygame.draw.rect(screen, (255, 120, 0), (x, y, CELL_W * self.length, CELL_W // 2), width=2, border_radius=6)
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return self.img or get_explosion_fallback(self.length), self.pos
 
 class Arrow:
     def __init__(self, pointing: str, center: Tuple[int, int],
@@ -262,40 +367,60 @@ class Arrow:
         self.size_min = size_min
         self.size_max = size_max
         self._cache: dict[str, Tuple[pygame.font.Font, Tuple[int, int]]] = {}
+        # 외곽선까지 합성한 단어 이미지 — 단어/위치가 바뀔 때만 다시 만듦
+        self._surf: Optional[pygame.Surface] = None
+        self._pos = (0, 0)
 
     def set_center(self, center: Tuple[int, int]):
         self.cx, self.cy = center
+        self._surf = None
 
     def set_word(self, word: str):
-        self.word = word
+        if word != self.word:
+            self.word = word
+            self._surf = None
 
     def _font_fit(self, text: str) -> Tuple[pygame.font.Font, Tuple[int, int]]:
         if text in self._cache:
             return self._cache[text]
         lo, hi = self.size_min, self.size_max
-        best_font = pygame.font.SysFont(self.font_name, lo, bold=True)
-        best_size = best_font.size(text)
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            f = pygame.font.SysFont(self.font_name, mid, bold=True)
+        size = hi
+        f = sysfont(self.font_name, size, True)
+        w, h = f.size(text)
+        if w > self.max_width:
+            # 폭은 글자 크기에 거의 비례 → 한 번 측정으로 크기를 추정하고 ±1 로 보정
+            size = min(hi, max(lo, hi * self.max_width // max(1, w)))
+            f = sysfont(self.font_name, size, True)
             w, h = f.size(text)
-            if w <= self.max_width:
-                best_font, best_size = f, (w, h)
-                lo = mid + 1
-            else:
-                hi = mid - 1
-        self._cache[text] = (best_font, best_size)
-        return best_font, best_size
-
-    def draw(self, surface: pygame.Surface):
+            while w > self.max_width and size > lo:
+                size -= 1
+                f = sysfont(self.font_name, size, True)
+                w, h = f.size(text)
+            while size < hi:
+                nf = sysfont(self.font_name, size + 1, True)
+                nw, nh = nf.size(text)
+                if nw > self.max_width:
+                    break
+                size, f, w, h = size + 1, nf, nw, nh
+        self._cache[text] = (f, (w, h))
+        return f, (w, h)
+
+    def _build_surface(self):
         font, (tw, th) = self._font_fit(self.word)
-        tx = self.cx - tw // 2
-        ty = self.cy - th // 2
-        for dx, dy in [(-3, 0), (3, 0), (0, -3), (0, 3), (-2, -2), (2, -2), (-2, 2), (2, 2)]:
-            outline = font.render(self.word, True, WORD_OUTLINE)
-            surface.blit(outline, (tx + dx, ty + dy))
-        text = font.render(self.word, True, self.word_color)
-        surface.blit(text, (tx, ty))
+        pad = WORD_OUTLINE_PAD
+        surf = pygame.Surface((tw + pad * 2, th + pad * 2), pygame.SRCALPHA).convert_alpha()
+        # 단어는 대부분 한 번만 쓰이므로 공유 LRU 를 거치지 않고 외곽선/본문을 각각 한 번씩만 렌더링
+        outline = font.render(self.word, True, WORD_OUTLINE)
+        for dx, dy in WORD_OUTLINE_OFFSETS:
+            surf.blit(outline, (pad + dx, pad + dy))
+        surf.blit(font.render(self.word, True, self.word_color), (pad, pad))
+        self._surf = surf
+        self._pos = (self.cx - tw // 2 - pad, self.cy - th // 2 - pad)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        if self._surf is None:
+            self._build_surface()
+        return surface.blit(self._surf, self._pos)
 
 # -----------------------------
 # Game
@@ -305,21 +430,50 @@ class Game:
         pygame.init()
         pygame.display.set_caption("Typing Dodge — Random Word API")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # 처리하는 이벤트만 큐에 쌓이게 함 (TEXTINPUT 은 KEYDOWN.unicode 에 필요)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, ACCEL_EVENT])
         self.clock = pygame.time.Clock()
 
-        self.font_ui = pygame.font.SysFont(FONT_NAME, 22, bold=False)
-        self.font_big = pygame.font.SysFont(FONT_NAME, 30, bold=True)
-        self.font_h1 = pygame.font.SysFont(FONT_NAME, 40, bold=True)
-        self.font_input = pygame.font.SysFont(FONT_NAME, 28, bold=False)
+        self.font_ui = sysfont(FONT_NAME, 22, False)
+        self.font_big = sysfont(FONT_NAME, 30, True)
+        self.font_h1 = sysfont(FONT_NAME, 40, True)
+        self.font_input = sysfont(FONT_NAME, 28, False)
 
         self.bg = Background(self.screen)
+        # 스폰 도중 디스크 로딩/스케일이 일어나지 않도록 블록 이미지를 미리 준비
+        for length in range(1, BLOCK_LEN_MAX + 1):
+            get_block_image(length)
+        self._grid_surf = self._build_grid_surface()
+        # 메뉴 항목: (선택, 비선택) 두 상태를 미리 렌더링
+        self._menu_surfs = [
+            (self.font_big.render("▶ " + label, True, (120, 180, 255)),
+             self.font_big.render("   " + label, True, (200, 200, 200)))
+            for label in STAGE_LABELS
+        ]
         self.player = Player(COLS // 2)
         self.blocks: list[Block] = []
         self.explosions: list[Explosion] = []
+        self._danger_mask = 0
 
         self.input_buf = ""
         self.elapsed_ms = 0
         self.state = GameState.MENU
+
+        # 화면 갱신 영역 추적 (display.update 용)
+        self._dirty_rects: list[pygame.Rect] = []
+        self._prev_dirty_rects: list[pygame.Rect] = []
+        self._full_redraw = True
+        self._presented_state: Optional[GameState] = None
+
+        self._input_key: Optional[str] = None
+        self._input_surf: Optional[pygame.Surface] = None
+        self._input_pos = (0, 0)
+
+        self._hud_time_sec = -1
+        self._hud_time_surf: Optional[pygame.Surface] = None
+        self._hud_help_surf = self._build_hud_help_surface()
         self.menu_selected = 0
 
         self.current_stage_id = 1
@@ -327,7 +481,7 @@ class Game:
 
         self.accel_multiplier = 1.0
         self.accel_interval_ms = ACCEL_INTERVAL_START_MS
-        self.next_accel_due_ms = ACCEL_INTERVAL_START_MS
+        self._refresh_step_interval()
 
         self.spawn_ms = max(SPAWN_MS_LOWER_BOUND, int(self.stage_base.spawn_ms))
         self.spawn_acc = 0
@@ -362,9 +516,8 @@ class Game:
         self.final_score = 0
         self.best_score = 0  # 세션 내 최고점
 
-        print(f"🎮 Stage {self.current_stage_id} 단어 캐시 로딩 중...")
-        fetch_words_from_api(100)
-        print(f"✅ 로딩 완료: {len(WORD_CACHE)}개 단어")
+        # 메뉴에 있는 동안 단어를 미리 받아 둠
+        start_word_prefetch()
 
     def _make_word(self) -> str:
         return get_random_word()
@@ -378,62 +531,55 @@ class Game:
         self.right_arrow.set_word(self.right_word)
 
     def _apply_acceleration(self):
-        if self.elapsed_ms >= self.next_accel_due_ms:
-            self.accel_multiplier *= ACCEL_RATIO
-            self.accel_interval_ms = max(ACCEL_INTERVAL_MIN_MS, self.accel_interval_ms - ACCEL_INTERVAL_STEP_MS)
-            self.next_accel_due_ms += self.accel_interval_ms
-            self.spawn_ms = max(SPAWN_MS_LOWER_BOUND, int(self.stage_base.spawn_ms / self.accel_multiplier))
+        # ACCEL_EVENT 타이머가 울릴 때만 호출됨 — 가속 후 다음 타이머 예약
+        self.accel_multiplier *= ACCEL_RATIO
+        self.accel_interval_ms = max(ACCEL_INTERVAL_MIN_MS, self.accel_interval_ms - ACCEL_INTERVAL_STEP_MS)
+        self.spawn_ms = max(SPAWN_MS_LOWER_BOUND, int(self.stage_base.spawn_ms / self.accel_multiplier))
+        self._refresh_step_interval()
+        pygame.time.set_timer(ACCEL_EVENT, self.accel_interval_ms, loops=1)
 
     def _effective_steps_per_sec(self) -> float:
         return self.stage_base.steps_per_sec * self.accel_multiplier
 
-    def _nearest_safe_moves(self, player_col: int, start_col: int, length: int) -> int:
-        s = start_col
-        e = start_col + length - 1
-        candidates = []
-        if s - 1 >= 0: candidates.append(abs(player_col - (s - 1)))
-        if e + 1 <= COLS - 1: candidates.append(abs(player_col - (e + 1)))
-        return min(candidates) if candidates else 0
+    def _refresh_step_interval(self):
+        # 스테이지 시작/가속 시점에만 블록 스텝 간격을 다시 계산해 살아있는 블록에 반영
+        self._step_interval_ms = step_interval_for(self._effective_steps_per_sec())
+        for b in self.blocks:
+            b.step_interval_ms = self._step_interval_ms
 
     def _spawn_block_safe(self):
+        # 후보 검사는 정수 계산만 하고, 통과한 후보에 대해서만 Block 을 생성
+        interval = self._step_interval_ms
+        # 새 블록은 항상 같은 높이에서 시작하므로 바닥까지 시간은 후보와 무관
+        ttg = time_to_ground_ms(-BLOCK_H, interval)
+        # 한 번의 호출 동안 플레이어 열은 그대로이므로 해당 행만 꺼내 둠
+        need_ms = SPAWN_NEED_MS[self.player.col]
         for _ in range(12):
-            length = random.randint(2, min(4, COLS - 1))
+            length = random.randint(2, BLOCK_LEN_MAX)
             start_col = random.randint(0, COLS - length)
 
-            b = Block(start_col, length, steps_per_sec_base=self.stage_base.steps_per_sec)
-            b.bind_runtime(self._effective_steps_per_sec)
-
-            ttg = b.time_to_ground_ms()
-            need_moves = self._nearest_safe_moves(self.player.col, start_col, length)
-            need_ms = int((need_moves / MOVES_PER_SEC) * 1000) + SAFETY_MARGIN_MS
-
-            if need_ms <= ttg:
-                self.blocks.append(b)
-                return True
+            if need_ms[start_col][length] <= ttg:
+                return self._add_block(start_col, length, interval)
 
             alt_start = max(0, min(COLS - length, start_col + random.choice((-1, +1))))
-            b2 = Block(alt_start, length, steps_per_sec_base=self.stage_base.steps_per_sec)
-            b2.bind_runtime(self._effective_steps_per_sec)
-            if int((self._nearest_safe_moves(self.player.col, alt_start, length) / MOVES_PER_SEC) * 1000) + SAFETY_MARGIN_MS <= b2.time_to_ground_ms():
-                self.blocks.append(b2)
-                return True
+            if need_ms[alt_start][length] <= ttg:
+                return self._add_block(alt_start, length, interval)
 
             if length > 1:
                 length2 = length - 1
                 alt2 = random.randint(0, COLS - length2)
-                b3 = Block(alt2, length2, steps_per_sec_base=self.stage_base.steps_per_sec)
-                b3.bind_runtime(self._effective_steps_per_sec)
-                if int((self._nearest_safe_moves(self.player.col, alt2, length2) / MOVES_PER_SEC) * 1000) + SAFETY_MARGIN_MS <= b3.time_to_ground_ms():
-                    self.blocks.append(b3)
-                    return True
+                if need_ms[alt2][length2] <= ttg:
+                    return self._add_block(alt2, length2, interval)
         return False
 
+    def _add_block(self, start_col: int, length: int, interval: int) -> bool:
+        self.blocks.append(Block(start_col, length, self.stage_base.steps_per_sec, interval))
+        return True
+
     def update(self, dt: int):
         if self.state != GameState.PLAY:
             return
         self.elapsed_ms += dt
-        self._apply_acceleration()
-        self.bg.update(dt)
 
         self.spawn_acc += dt
         if self.spawn_acc >= self.spawn_ms:
@@ -442,27 +588,31 @@ class Game:
             else:
                 self.spawn_acc = self.spawn_ms // 2
 
-        for b in self.blocks:
-            b.update(dt)
-
-        alive_blocks = []
-        for b in self.blocks:
-            if b.hit_ground():
-                self.explosions.append(Explosion(b.start_col, b.length))
-            else:
-                alive_blocks.append(b)
-        self.blocks = alive_blocks
-
-        alive_ex = []
-        for ex in self.explosions:
+        # 대부분의 프레임은 제거할 것이 없으므로 새 리스트를 만들지 않고 제자리에서 pop
+        for i in range(len(self.blocks) - 1, -1, -1):
+            b = self.blocks[i]
+            if b.update(dt):
+                ex = Explosion(b.start_col, b.length)
+                self.explosions.append(ex)
+                self._danger_mask |= ex.mask
+                self.blocks.pop(i)
+
+        expired = False
+        for i in range(len(self.explosions) - 1, -1, -1):
+            ex = self.explosions[i]
             ex.update(dt)
-            if ex.alive():
-                s, e = ex.danger_cols
-                if s <= self.player.col <= e:
-                    self.state = GameState.OVER
-            if ex.alive():
-                alive_ex.append(ex)
-        self.explosions = alive_ex
+            if not ex.alive():
+                self.explosions.pop(i)
+                expired = True
+        if expired:
+            # 폭발끼리 열이 겹칠 수 있으므로 XOR 대신 남은 폭발로 다시 계산
+            mask = 0
+            for ex in self.explosions:
+                mask |= ex.mask
+            self._danger_mask = mask
+
+        if self._danger_mask & (1 << self.player.col):
+            self.state = GameState.OVER
 
         # 게임오버 확정 시 점수 계산(한 번만)
         if self.state == GameState.OVER and not self.gameover_processed:
@@ -471,12 +621,9 @@ class Game:
             if self.final_score > self.best_score:
                 self.best_score = self.final_score
             self.gameover_processed = True
+            pygame.time.set_timer(ACCEL_EVENT, 0)
             print(f"🧮 Score 계산: Survived {self.final_time_s}s → Score {self.final_score}")
 
-    def type_char(self, ch: str):
-        if ch and ch.isprintable() and ch not in ("\r", "\n"):
-            self.input_buf += ch
-
     def commit_input(self):
         buf = self.input_buf
         if not buf:
@@ -489,36 +636,67 @@ class Game:
             self._refresh_right()
         self.input_buf = ""
 
-    def _draw_grid(self):
+    def _build_grid_surface(self) -> pygame.Surface:
+        # 그리드는 정적이므로 한 번만 그려두고 매 프레임 blit
+        ox, oy = MARGIN_X - 4, TOP_MARGIN
+        surf = pygame.Surface((FIELD_W + 8, GROUND_Y - TOP_MARGIN + 8)).convert()
+        surf.fill((0, 0, 0))
         for c in range(COLS + 1):
-            x = MARGIN_X + c * CELL_W
+            x = MARGIN_X + c * CELL_W - ox
             for y in range(TOP_MARGIN, GROUND_Y, 20):
-                pygame.draw.line(self.screen, (255, 250, 235, 100),
-                                 (x, y), (x, y + 10), 1)
-        pygame.draw.line(self.screen, (160, 130, 100),
-                         (MARGIN_X, GROUND_Y),
-                         (MARGIN_X + FIELD_W, GROUND_Y), 4)
+                pygame.draw.line(surf, (255, 250, 235, 100),
+                                 (x, y - oy), (x, y + 10 - oy), 1)
+        pygame.draw.line(surf, (160, 130, 100),
+                         (MARGIN_X - ox, GROUND_Y - oy),
+                         (MARGIN_X + FIELD_W - ox, GROUND_Y - oy), 4)
+        return surf
+
+    def _draw_grid(self):
+        self.screen.blit(self._grid_surf, (MARGIN_X - 4, TOP_MARGIN))
 
     def draw_world(self):
         self._draw_grid()
+        dirty = self._dirty_rects
+        # 블록/폭발/플레이어를 Surface.blits() 한 번으로 묶어서 그림 (이미지 없는 것만 개별 draw)
+        seq = []
         for b in self.blocks:
-            b.draw(self.screen)
-        for ex in self.explosions:
-            ex.draw(self.screen)
-        self.player.draw(self.screen)
+            if b.img:
+                seq.append(b.blit_item())
+            else:
+                dirty.append(b.draw(self.screen))
+        seq.extend(ex.blit_item() for ex in self.explosions)
+        if self.player.img:
+            seq.append((self.player.img, self.player.rect))
+            dirty.extend(self.screen.blits(seq))
+        else:
+            dirty.extend(self.screen.blits(seq))
+            dirty.append(self.player.draw(self.screen))
 
-    def draw_top_left_hud(self):
+    def _build_hud_help_surface(self) -> pygame.Surface:
+        # 고정 안내 문구 3줄을 한 장으로 합쳐 두고 매 프레임 한 번만 blit
         lines = [
-            f"Time: {self.elapsed_ms // 1000}s",
-            "Enter: confirm word",
-            "Backspace: delete input",
-            "ESC: quit, (Game Over) R: restart",
+            self.font_ui.render(t, True, (220, 220, 220))
+            for t in HUD_HELP_LINES
         ]
+        w = max(l.get_width() for l in lines)
+        h = (len(lines) - 1) * 22 + lines[-1].get_height()
+        surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+        for i, line in enumerate(lines):
+            surf.blit(line, (0, i * 22), special_flags=pygame.BLEND_RGBA_MAX)
+        return surf
+
+    def draw_top_left_hud(self):
+        sec = self.elapsed_ms // 1000
+        if sec != self._hud_time_sec:
+            # Time 줄은 초가 바뀔 때만 다시 렌더링
+            self._hud_time_sec = sec
+            self._hud_time_surf = self.font_ui.render(f"Time: {sec}s", True, (220, 220, 220))
         x0, y0 = 16, 12
-        for i, t in enumerate(lines):
-            self.screen.blit(self.font_ui.render(t, True, (220, 220, 220)), (x0, y0 + i * 22))
+        self._dirty_rects.append(self.screen.blit(self._hud_time_surf, (x0, y0)))
+        # 반투명이고 블록과 겹칠 수 있으므로 매 프레임 지우고 다시 그리는 영역에 포함
+        self._dirty_rects.append(self.screen.blit(self._hud_help_surf, (x0, y0 + 22)))
 
-    def draw_bottom_center_input(self):
+    def _build_input_surface(self):
         buf_text = f"> {self.input_buf}"
         surf = self.font_input.render(buf_text, True, (230, 230, 230))
         pad_x, pad_y = 16, 12
@@ -526,32 +704,34 @@ class Game:
         pygame.draw.rect(bg, (30, 30, 30, 220), bg.get_rect(), border_radius=12)
         shadow = pygame.Surface(bg.get_size(), pygame.SRCALPHA)
         pygame.draw.rect(shadow, (0, 0, 0, 80), shadow.get_rect(), border_radius=14)
-        x = (WIDTH - bg.get_width()) // 2
-        y = GROUND_Y + 34
-        self.screen.blit(shadow, (x + 2, y + 2))
-        self.screen.blit(bg, (x, y))
-        self.screen.blit(surf, (x + pad_x, y + pad_y))
+        # 입력창 영역은 항상 검은 배경 위이므로 그림자/배경/글자를 불투명 한 장으로 합성
+        box = pygame.Surface((bg.get_width() + 2, bg.get_height() + 2)).convert()
+        box.fill((0, 0, 0))
+        box.blit(shadow, (2, 2))
+        box.blit(bg, (0, 0))
+        box.blit(surf, (pad_x, pad_y))
+        self._input_surf = box
+        self._input_pos = ((WIDTH - bg.get_width()) // 2, GROUND_Y + 34)
+
+    def draw_bottom_center_input(self):
+        # 입력이 바뀐 프레임에만 다시 합성
+        if self._input_key != self.input_buf:
+            self._input_key = self.input_buf
+            self._build_input_surface()
+        self._dirty_rects.append(self.screen.blit(self._input_surf, self._input_pos))
 
     def draw_center(self):
-        self.left_arrow.draw(self.screen)
-        self.right_arrow.draw(self.screen)
+        self._dirty_rects.append(self.left_arrow.draw(self.screen))
+        self._dirty_rects.append(self.right_arrow.draw(self.screen))
 
     def draw_menu(self):
-        title = self.font_h1.render("Stage Select", True, (230, 230, 230))
-        hint = self.font_ui.render("숫자(1~3) 또는 ←/→, Enter로 시작", True, (220, 220, 220))
+        title = render_text(self.font_h1, "Stage Select", (230, 230, 230))
+        hint = render_text(self.font_ui, "숫자(1~3) 또는 ←/→, Enter로 시작", (220, 220, 220))
         self.screen.blit(title, (MARGIN_X, 40))
         self.screen.blit(hint, (MARGIN_X, 90))
-        labels = [
-            "Stage 1  — 쉬움, 1 step/s, spawn=8.0s",
-            "Stage 2  — 보통, 1.8 step/s, 5.5s",
-            "Stage 3  — 어려움, 2.4 step/s, 3.5s",
-        ]
         y = 140
-        for i, label in enumerate(labels):
-            sel = (i == self.menu_selected)
-            bullet = "▶ " if sel else "   "
-            color = (120, 180, 255) if sel else (200, 200, 200)
-            line = self.font_big.render(bullet + label, True, color)
+        for i, (sel_surf, idle_surf) in enumerate(self._menu_surfs):
+            line = sel_surf if i == self.menu_selected else idle_surf
             self.screen.blit(line, (MARGIN_X, y))
             y += 36
 
@@ -581,7 +761,7 @@ class Game:
         pad_x, pad_y = 24, 20
         cx = card_x + card_w // 2
 
-        title = self.font_h1.render("GAME OVER", True, (15, 15, 15))
+        title = render_text(self.font_h1, "GAME OVER", (15, 15, 15))
         self.screen.blit(title, (cx - title.get_width() // 2, card_y + pad_y))
 
         # 구분선
@@ -592,25 +772,23 @@ class Game:
 
         # 점수/시간/베스트
         info_y = line_y + 18
-        score_line = self.font_big.render(f"Score : {self.final_score}", True, (20, 20, 20))
-        time_line  = self.font_ui.render (f"Time   : {self.final_time_s}s", True, (35, 35, 35))
-        best_line  = self.font_ui.render (f"Best   : {self.best_score}", True, (35, 35, 35))
+        score_line = render_text(self.font_big, f"Score : {self.final_score}", (20, 20, 20))
+        time_line  = render_text(self.font_ui,  f"Time   : {self.final_time_s}s", (35, 35, 35))
+        best_line  = render_text(self.font_ui,  f"Best   : {self.best_score}", (35, 35, 35))
 
         self.screen.blit(score_line, (cx - score_line.get_width() // 2, info_y))
         self.screen.blit(time_line,  (cx - time_line.get_width()  // 2, info_y + 36))
         self.screen.blit(best_line,  (cx - best_line.get_width()  // 2, info_y + 62))
 
         # 안내 문구
-        hint_text = self.font_ui.render("Press R to Restart, ESC to Quit", True, (55, 55, 55))
+        hint_text = render_text(self.font_ui, "Press R to Restart, ESC to Quit", (55, 55, 55))
         self.screen.blit(hint_text, (cx - hint_text.get_width() // 2, card_y + card_h - pad_y - hint_text.get_height()))
 
 
     def _start_fixed_stage(self):
-        global WORD_CACHE
-        WORD_CACHE.clear()
-
         self.blocks.clear()
         self.explosions.clear()
+        self._danger_mask = 0
         self.player = Player(COLS // 2)
         self.input_buf = ""
         self.elapsed_ms = 0
@@ -618,7 +796,7 @@ class Game:
 
         self.accel_multiplier = 1.0
         self.accel_interval_ms = ACCEL_INTERVAL_START_MS
-        self.next_accel_due_ms = ACCEL_INTERVAL_START_MS
+        self._refresh_step_interval()
 
         self.spawn_ms = max(SPAWN_MS_LOWER_BOUND, int(self.stage_base.spawn_ms))
 
@@ -627,32 +805,60 @@ class Game:
         self.final_time_s = 0
         self.final_score = 0
 
-        print(f"🎮 Stage {self.current_stage_id} 시작 - 단어 로딩 중...")
-        fetch_words_from_api(100)
-        print(f"✅ 로딩 완료: {len(WORD_CACHE)}개 단어")
-
         self.left_word = self._make_word()
         self.right_word = self._make_word()
         self.left_arrow.set_word(self.left_word)
         self.right_arrow.set_word(self.right_word)
 
         self.state = GameState.PLAY
+        pygame.time.set_timer(ACCEL_EVENT, ACCEL_INTERVAL_START_MS, loops=1)
 
         if not self._spawn_block_safe():
             self.spawn_acc = self.spawn_ms // 2
         else:
             self.spawn_acc = 0
 
+    def _screen_stale(self) -> bool:
+        return self._full_redraw or self.state != self._presented_state
+
+    def _present(self):
+        # 상태가 바뀌었거나 전체 갱신이 필요할 때만 flip, PLAY 중에는 변한 영역만 갱신
+        if self._screen_stale():
+            pygame.display.flip()
+            self._full_redraw = False
+            self._presented_state = self.state
+        elif self.state == GameState.PLAY:
+            # 이전 프레임 영역까지 포함해야 사라진 물체 자리가 지워짐
+            pygame.display.update(self._prev_dirty_rects + self._dirty_rects)
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+
     def run(self):
         running = True
         while running:
-            dt = self.clock.tick(FPS)
-            for e in pygame.event.get():
+            idle = self.state != GameState.PLAY
+            dt = self.clock.tick(IDLE_FPS if idle else FPS)
+            if idle:
+                # 움직이는 것이 없는 화면은 입력이 올 때까지 잠들어 CPU 사용을 줄임
+                first = pygame.event.wait(IDLE_WAIT_MS)
+                events = pygame.event.get()
+                if first.type != pygame.NOEVENT:
+                    events.insert(0, first)
+            else:
+                events = pygame.event.get()
+            for e in events:
                 if e.type == pygame.QUIT:
                     running = False
+                elif e.type == ACCEL_EVENT:
+                    if self.state == GameState.PLAY:
+                        self._apply_acceleration()
+                elif e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._full_redraw = True
                 elif e.type == pygame.KEYDOWN:
                     if e.key == pygame.K_ESCAPE:
                         running = False
+                    if self.state != GameState.PLAY:
+                        self._full_redraw = True
 
                     if self.state == GameState.MENU:
                         if e.key in (pygame.K_RIGHT, pygame.K_d):
@@ -672,15 +878,24 @@ class Game:
                         elif e.key == pygame.K_RETURN:
                             self.commit_input()
                         else:
-                            if e.unicode and e.unicode.isprintable():
-                                self.type_char(e.unicode.lower())
+                            ch = e.unicode.lower()
+                            if ch in TYPEABLE_CHARS:
+                                self.input_buf += ch
 
                     elif self.state == GameState.OVER:
                         if e.key == pygame.K_r:
                             self._start_fixed_stage()
 
+            # 메뉴/게임오버 화면은 입력이나 상태 변화가 없으면 그리기와 표시를 모두 건너뜀
+            if self.state != GameState.PLAY and not self._screen_stale():
+                continue
+
             self.bg.update(dt)
-            self.bg.draw()
+            if self.state == GameState.PLAY and not self._screen_stale():
+                # 나머지 화면은 이전 프레임 그대로이므로 지난 프레임에 그린 영역만 지움
+                self.bg.erase(self._prev_dirty_rects)
+            else:
+                self.bg.draw()
 
             if self.state == GameState.MENU:
                 self.draw_menu()
@@ -699,7 +914,7 @@ class Game:
                 self.draw_bottom_center_input()
                 self.draw_gameover()
 
-            pygame.display.flip()
+            self._present()
 
         pygame.quit()
         sys.exit()